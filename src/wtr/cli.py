@@ -1,145 +1,47 @@
 """CLI entry point for worktree manager."""
 
+from __future__ import annotations
+
 import argparse
 import os
 import subprocess
 import sys
 from importlib.metadata import version
 from pathlib import Path
-
-import yaml
+from typing import TYPE_CHECKING
 
 __version__ = version("wtr")
 
-from .config import load_config
-from .git import GitWorktreeManager, create_shared_symlinks
-from .tui import run_tui
+if TYPE_CHECKING:
+    from .git import GitWorktreeManager
 
 SHARE_OBJ_FILENAME = "share_obj.yaml"
 LOG_DIR_NAME = "log_dir"
 
 
+CD_FILE = f"/tmp/.wtr_cd_{os.environ.get('USER', 'unknown')}"
+
+
 def request_cd(path: str | Path) -> None:
     """Request shell wrapper to cd to path after exit."""
-    cd_file = f"/tmp/.wtr_cd_{os.environ.get('USER', 'unknown')}"
-    with open(cd_file, "w") as f:
-        f.write(str(path))
-
-
-SHELL_COMPLETIONS = {
-    "zsh": """\
-#compdef wtr
-
-_wtr() {
-    local -a branches worktrees tags
-
-    # Get existing worktrees
-    worktrees=($(command wtr --list 2>/dev/null | cut -f1))
-
-    # Get local branches
-    branches=($(git branch --format='%(refname:short)' 2>/dev/null))
-
-    # Get tags
-    tags=($(git tag 2>/dev/null))
-
-    # Handle subcommands
-    if [[ "${words[2]}" == "add" ]]; then
-        _arguments \\
-            '1:name:($branches)' \\
-            '(-b --base)'{-b,--base}'[Base branch]:branch:($branches)' \\
-            '(-c --commit)'{-c,--commit}'[Commit or tag]:commit:($tags)' \\
-            '(-B --new-branch)'{-B,--new-branch}'[Create branch from commit]'
-        return
-    fi
-
-    _arguments -C \\
-        '(-l --list)'{-l,--list}'[List existing worktrees]' \\
-        '(-d --delete)'{-d,--delete}'[Delete worktree]:branch:($worktrees)' \\
-        '--prune[Remove stale worktrees]' \\
-        '--completion[Generate shell completion]:shell:(zsh bash fish)' \\
-        '1:worktree or command:(add $worktrees)'
-}
-
-compdef _wtr wtr
-""",
-    "bash": """\
-_wtr() {
-    local cur prev opts
-    COMPREPLY=()
-    cur="${COMP_WORDS[COMP_CWORD]}"
-    prev="${COMP_WORDS[COMP_CWORD-1]}"
-    opts="-l --list -d --delete --prune --completion add"
-
-    # Handle 'add' subcommand
-    if [[ "${COMP_WORDS[1]}" == "add" ]]; then
-        case "${prev}" in
-            -b|--base)
-                local branches=$(git branch --format='%(refname:short)' 2>/dev/null)
-                COMPREPLY=( $(compgen -W "${branches}" -- ${cur}) )
-                return 0
-                ;;
-            -c|--commit)
-                local tags=$(git tag 2>/dev/null)
-                COMPREPLY=( $(compgen -W "${tags}" -- ${cur}) )
-                return 0
-                ;;
-        esac
-        if [[ ${cur} == -* ]]; then
-            COMPREPLY=( $(compgen -W "-b --base -c --commit -B --new-branch" -- ${cur}) )
-        else
-            local branches=$(git branch --format='%(refname:short)' 2>/dev/null)
-            COMPREPLY=( $(compgen -W "${branches}" -- ${cur}) )
-        fi
-        return 0
-    fi
-
-    case "${prev}" in
-        -d|--delete)
-            local worktrees=$(wtr --list 2>/dev/null | cut -f1)
-            COMPREPLY=( $(compgen -W "${worktrees}" -- ${cur}) )
-            return 0
-            ;;
-        --completion)
-            COMPREPLY=( $(compgen -W "zsh bash fish" -- ${cur}) )
-            return 0
-            ;;
-    esac
-
-    if [[ ${cur} == -* ]]; then
-        COMPREPLY=( $(compgen -W "${opts}" -- ${cur}) )
-    else
-        local worktrees=$(wtr --list 2>/dev/null | cut -f1)
-        COMPREPLY=( $(compgen -W "add ${worktrees}" -- ${cur}) )
-    fi
-}
-complete -F _wtr wtr
-""",
-    "fish": """\
-function __fish_wtr_branches
-    git branch --format='%(refname:short)' 2>/dev/null
-end
-
-function __fish_wtr_worktrees
-    wtr --list 2>/dev/null | cut -f1
-end
-
-function __fish_wtr_tags
-    git tag 2>/dev/null
-end
-
-complete -c wtr -f
-complete -c wtr -s l -l list -d 'List existing worktrees'
-complete -c wtr -s d -l delete -d 'Delete worktree' -xa '(__fish_wtr_worktrees)'
-complete -c wtr -l prune -d 'Remove stale worktrees'
-complete -c wtr -l completion -d 'Generate completion' -xa 'zsh bash fish'
-complete -c wtr -n '__fish_is_first_arg' -a 'add' -d 'Create new worktree'
-complete -c wtr -n '__fish_is_first_arg' -xa '(__fish_wtr_worktrees)'
-complete -c wtr -n '__fish_seen_subcommand_from add' -xa '(__fish_wtr_branches)'
-complete -c wtr -n '__fish_seen_subcommand_from add' -s b -l base -d 'Base branch' -xa '(__fish_wtr_branches)'
-complete -c wtr -n '__fish_seen_subcommand_from add' -s c -l commit -d 'Commit or tag' -xa '(__fish_wtr_tags)'
-complete -c wtr -n '__fish_seen_subcommand_from add' -s B -l new-branch -d 'Create branch from commit'
-""",
-}
+    # Raw fd write: no buffered/text IO stack for a single small write,
+    # and the file is created readable by the user only
+    fd = os.open(CD_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, os.fsencode(str(path)))
+    finally:
+        os.close(fd)
+
+
+# Completion scripts ship as package data (completions/wtr.<shell>)
+COMPLETION_SHELLS = ("zsh", "bash", "fish")
+
+
+def read_completion(shell: str) -> str:
+    """Read completion script for shell from package data."""
+    from importlib.resources import files
+
+    return files("wtr").joinpath("completions").joinpath(f"wtr.{shell}").read_text()
 
 
 HELP_EPILOG = """\
@@ -163,8 +65,8 @@ Examples:
 """
 
 
-def handle_add_command() -> int:
-    """Handle 'wtr add' subcommand with separate parser."""
+def build_add_parser() -> argparse.ArgumentParser:
+    """Build argument parser for 'wtr add'."""
     parser = argparse.ArgumentParser(
         description="Create new worktree",
         prog="wtr add",
@@ -190,8 +92,23 @@ def handle_add_command() -> int:
         dest="create_branch",
         help="Create new branch from commit (use with -c)",
     )
+    return parser
 
-    args = parser.parse_args(sys.argv[2:])
+
+def handle_add_command() -> int:
+    """Handle 'wtr add' subcommand with separate parser."""
+    argv = sys.argv[2:]
+
+    # Plain 'wtr add NAME' is the common case: skip building the parser
+    if len(argv) == 1 and not argv[0].startswith("-"):
+        args = argparse.Namespace(
+            target=argv[0],
+            base=None,
+            commit=None,
+            create_branch=False,
+        )
+    else:
+        args = build_add_parser().parse_args(argv)
 
     # Validate arguments
     if args.commit and args.base:
@@ -213,6 +130,9 @@ def handle_add_command() -> int:
         return 2
 
     try:
+        from .config import load_config
+        from .git import GitWorktreeManager
+
         manager = GitWorktreeManager()
         config = load_config(manager.root)
     except RuntimeError as e:
@@ -233,12 +153,29 @@ def handle_add_command() -> int:
     )
 
 
+def _sniff_completion(argv: list[str]) -> str | None:
+    """Return shell name passed via --completion, or None if absent."""
+    for i, arg in enumerate(argv):
+        if arg == "--completion":
+            return argv[i + 1] if i + 1 < len(argv) else None
+        if arg.startswith("--completion="):
+            return arg.split("=", 1)[1]
+    return None
+
+
 def main() -> int:
     """Main entry point."""
     # Handle 'add' subcommand separately to avoid argparse conflicts
     if len(sys.argv) >= 2 and sys.argv[1] == "add":
         return handle_add_command()
 
+    # Fast path for --completion: print script without building the parser.
+    # Unknown shells fall through so argparse reports the error.
+    shell = _sniff_completion(sys.argv[1:])
+    if shell in COMPLETION_SHELLS:
+        print(read_completion(shell))
+        return 1  # Don't cd
+
     parser = argparse.ArgumentParser(
         description="Git worktree manager with TUI",
         prog="wtr",
@@ -286,7 +223,7 @@ def main() -> int:
     parser.add_argument(
         "--completion",
         metavar="SHELL",
-        choices=["zsh", "bash", "fish"],
+        choices=COMPLETION_SHELLS,
         help="Generate shell completion script",
     )
     parser.add_argument(
@@ -299,7 +236,7 @@ def main() -> int:
 
     # Handle --completion (doesn't need git repo)
     if args.completion:
-        print(SHELL_COMPLETIONS[args.completion])
+        print(read_completion(args.completion))
         return 1  # Don't cd
 
     # Validate --log_dir and --doc_dir without --init
@@ -310,6 +247,9 @@ def main() -> int:
         print("Error: --doc_dir requires --init", file=sys.stderr)
         return 2
 
+    from .config import load_config
+    from .git import GitWorktreeManager
+
     try:
         manager = GitWorktreeManager()
         config = load_config(manager.root)
@@ -355,7 +295,9 @@ def main() -> int:
     if args.branch:
         return handle_quick_branch(manager, args.branch)
 
-    # Run TUI
+    # Run TUI (textual is only imported when actually needed)
+    from .tui import run_tui
+
     result = run_tui(manager, config)
     if result:
         request_cd(result)
@@ -470,6 +412,7 @@ def handle_init(
         if with_log_dir:
             share_obj_data[LOG_DIR_NAME] = [".aiwr"]
 
+        import yaml
         with open(share_obj_path, "w") as f:
             yaml.dump(share_obj_data, f, default_flow_style=False, allow_unicode=True)
 
@@ -543,13 +486,14 @@ def handle_quick_branch(
     branch: str,
 ) -> int:
     """Switch to existing worktree (no create)."""
-    worktrees = manager.list_worktrees()
+    path = manager.find_worktree(branch)
 
-    if branch in worktrees:
-        request_cd(worktrees[branch])
+    if path is not None:
+        request_cd(path)
         return 0
 
     # Worktree does not exist - error
+    worktrees = manager.list_worktrees()
     print(f"Worktree '{branch}' does not exist", file=sys.stderr)
     if worktrees:
         print(f"Available: {', '.join(sorted(worktrees.keys()))}", file=sys.stderr)
@@ -600,6 +544,8 @@ def handle_add(
                 path = manager.create_worktree(name, base_branch)
 
         # Create shared symlinks
+        from .git import create_shared_symlinks
+
         warnings = create_shared_symlinks(path, manager.container)
         for w in warnings:
             print(f"❗ {w}", file=sys.stderr)
@@ -0,0 +1,87 @@
+# Resolve git common dir once per directory (linked worktrees share refs)
+_wtr_git_dir() {
+    if [[ "${_wtr_git_dir_pwd}" != "${PWD}" ]]; then
+        _wtr_git_dir_path=$(git rev-parse --git-common-dir 2>/dev/null)
+        _wtr_git_dir_pwd="${PWD}"
+    fi
+}
+
+# List ref names under refs/<kind>/ from loose refs and packed-refs into
+# the _wtr_reply array, much faster than 'git branch'/'git tag' on repos
+# with many refs. Call it directly, not in $(...): the git dir cache must
+# be set in the completing shell, not in a subshell
+_wtr_refs() {
+    _wtr_reply=()
+    _wtr_git_dir
+    [[ -n "${_wtr_git_dir_path}" ]] || return
+    local dir="${_wtr_git_dir_path}/refs/$1"
+    _wtr_reply=($({
+        find "${dir}" -type f 2>/dev/null | sed "s,^${dir}/,,"
+        awk -v p="refs/$1/" 'index($2, p) == 1 { print substr($2, length(p) + 1) }' \
+            "${_wtr_git_dir_path}/packed-refs" 2>/dev/null
+    } | sort -u))
+}
+
+# Cache 'wtr --list' per directory for a few seconds, so repeated Tab
+# presses don't start Python every time
+_wtr_refresh_worktrees() {
+    if [[ "${_wtr_cache_dir}" != "${PWD}" || -z "${_wtr_cache_time}" ]] \
+        || (( SECONDS - _wtr_cache_time > 5 )); then
+        _wtr_cache_list=$(wtr --list 2>/dev/null | cut -f1)
+        _wtr_cache_dir="${PWD}"
+        _wtr_cache_time=${SECONDS}
+    fi
+}
+
+_wtr() {
+    local cur prev opts
+    COMPREPLY=()
+    cur="${COMP_WORDS[COMP_CWORD]}"
+    prev="${COMP_WORDS[COMP_CWORD-1]}"
+    opts="-l --list -d --delete --prune --completion add"
+
+    # Handle 'add' subcommand
+    if [[ "${COMP_WORDS[1]}" == "add" ]]; then
+        case "${prev}" in
+            -b|--base)
+                _wtr_refs heads
+                COMPREPLY=( $(compgen -W "${_wtr_reply[*]}" -- ${cur}) )
+                return 0
+                ;;
+            -c|--commit)
+                _wtr_refs tags
+                COMPREPLY=( $(compgen -W "${_wtr_reply[*]}" -- ${cur}) )
+                return 0
+                ;;
+        esac
+        if [[ ${cur} == -* ]]; then
+            COMPREPLY=( $(compgen -W "-b --base -c --commit -B --new-branch" -- ${cur}) )
+        else
+            _wtr_refs heads
+            COMPREPLY=( $(compgen -W "${_wtr_reply[*]}" -- ${cur}) )
+        fi
+        return 0
+    fi
+
+    case "${prev}" in
+        -d|--delete)
+            _wtr_refresh_worktrees
+            local worktrees="${_wtr_cache_list}"
+            COMPREPLY=( $(compgen -W "${worktrees}" -- ${cur}) )
+            return 0
+            ;;
+        --completion)
+            COMPREPLY=( $(compgen -W "zsh bash fish" -- ${cur}) )
+            return 0
+            ;;
+    esac
+
+    if [[ ${cur} == -* ]]; then
+        COMPREPLY=( $(compgen -W "${opts}" -- ${cur}) )
+    else
+        _wtr_refresh_worktrees
+        local worktrees="${_wtr_cache_list}"
+        COMPREPLY=( $(compgen -W "add ${worktrees}" -- ${cur}) )
+    fi
+}
+complete -F _wtr wtr
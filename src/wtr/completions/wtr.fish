@@ -0,0 +1,40 @@
+# List ref names under refs/<kind>/ from loose refs and packed-refs,
+# much faster than 'git branch'/'git tag' on repos with many refs
+function __fish_wtr_refs
+    # Resolve git common dir once per directory (linked worktrees share refs)
+    if test "$__fish_wtr_git_dir_pwd" != "$PWD"
+        set -g __fish_wtr_git_dir (git rev-parse --git-common-dir 2>/dev/null)
+        set -g __fish_wtr_git_dir_pwd $PWD
+    end
+    test -n "$__fish_wtr_git_dir"; or return
+    set -l dir "$__fish_wtr_git_dir/refs/$argv[1]"
+    begin
+        find $dir -type f 2>/dev/null | string replace -- "$dir/" ''
+        awk -v p="refs/$argv[1]/" 'index($2, p) == 1 { print substr($2, length(p) + 1) }' \
+            "$__fish_wtr_git_dir/packed-refs" 2>/dev/null
+    end | sort -u
+end
+
+function __fish_wtr_branches
+    __fish_wtr_refs heads
+end
+
+function __fish_wtr_worktrees
+    wtr --list 2>/dev/null | cut -f1
+end
+
+function __fish_wtr_tags
+    __fish_wtr_refs tags
+end
+
+complete -c wtr -f
+complete -c wtr -s l -l list -d 'List existing worktrees'
+complete -c wtr -s d -l delete -d 'Delete worktree' -xa '(__fish_wtr_worktrees)'
+complete -c wtr -l prune -d 'Remove stale worktrees'
+complete -c wtr -l completion -d 'Generate completion' -xa 'zsh bash fish'
+complete -c wtr -n '__fish_is_first_arg' -a 'add' -d 'Create new worktree'
+complete -c wtr -n '__fish_is_first_arg' -xa '(__fish_wtr_worktrees)'
+complete -c wtr -n '__fish_seen_subcommand_from add' -xa '(__fish_wtr_branches)'
+complete -c wtr -n '__fish_seen_subcommand_from add' -s b -l base -d 'Base branch' -xa '(__fish_wtr_branches)'
+complete -c wtr -n '__fish_seen_subcommand_from add' -s c -l commit -d 'Commit or tag' -xa '(__fish_wtr_tags)'
+complete -c wtr -n '__fish_seen_subcommand_from add' -s B -l new-branch -d 'Create branch from commit'
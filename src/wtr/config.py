@@ -1,77 +1,187 @@
 """Configuration file handling for wtr."""
 
+import os
 import sys
-from dataclasses import dataclass, field
 from pathlib import Path
 
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    import tomli as tomllib
+from . import __version__
+
+CACHE_DIR = Path.home() / ".cache" / "wtr"
+
+# Part of the config cache key, bump when the pickled Config classes change
+CACHE_SCHEMA = 1
 
 
-@dataclass
 class WorktreeConfig:
     """Worktree-related settings."""
 
-    default_base: str = ""  # empty = auto-detect (main or master)
+    __slots__ = ("default_base",)
+
+    def __init__(self, default_base: str = ""):
+        self.default_base = default_base  # empty = auto-detect (main or master)
 
 
-@dataclass
 class UIConfig:
     """UI-related settings."""
 
-    show_status: bool = True
-    show_preview: bool = True
-    preview_count: int = 5
+    __slots__ = ("show_status", "show_preview", "preview_count")
+
+    def __init__(
+        self,
+        show_status: bool = True,
+        show_preview: bool = True,
+        preview_count: int = 5,
+    ):
+        self.show_status = show_status
+        self.show_preview = show_preview
+        self.preview_count = preview_count
 
 
-@dataclass
 class PruneConfig:
     """Prune-related settings."""
 
-    auto_suggest: bool = True
+    __slots__ = ("auto_suggest",)
+
+    def __init__(self, auto_suggest: bool = True):
+        self.auto_suggest = auto_suggest
 
 
-@dataclass
 class Config:
     """Main configuration container."""
 
-    worktree: WorktreeConfig = field(default_factory=WorktreeConfig)
-    ui: UIConfig = field(default_factory=UIConfig)
-    prune: PruneConfig = field(default_factory=PruneConfig)
+    __slots__ = ("worktree", "ui", "prune")
+
+    def __init__(
+        self,
+        worktree: WorktreeConfig | None = None,
+        ui: UIConfig | None = None,
+        prune: PruneConfig | None = None,
+    ):
+        self.worktree = worktree or WorktreeConfig()
+        self.ui = ui or UIConfig()
+        self.prune = prune or PruneConfig()
 
 
 def find_config_file(repo_root: Path | None = None) -> Path | None:
     """Find config file in repo root or user config dir."""
-    candidates = []
-
     if repo_root:
-        candidates.append(repo_root / ".wtrrc")
-        candidates.append(repo_root / ".wtrrc.toml")
+        # One directory read instead of a stat per candidate
+        try:
+            with os.scandir(repo_root) as entries:
+                names = {entry.name for entry in entries}
+        except OSError:
+            names = set()
 
-    config_home = Path.home() / ".config" / "wtr"
-    candidates.append(config_home / "config.toml")
+        for name in (".wtrrc", ".wtrrc.toml"):
+            if name in names:
+                return repo_root / name
 
-    for path in candidates:
-        if path.exists():
-            return path
+    user_config = Path.home() / ".config" / "wtr" / "config.toml"
+    if user_config.exists():
+        return user_config
 
     return None
 
 
+def _cache_path(config_path: Path) -> Path:
+    """
+    Get cache file path for config file.
+
+    Named config-<path digest>-<state digest>.pickle: the state part covers
+    mtime, size, wtr version and CACHE_SCHEMA, so entries written for an
+    older file or an older wtr are never loaded.
+    """
+    import hashlib
+
+    st = config_path.stat()
+    path_key = str(config_path.resolve())
+    state_key = f"{st.st_mtime_ns}:{st.st_size}:{__version__}:{CACHE_SCHEMA}"
+    path_digest = hashlib.sha1(path_key.encode()).hexdigest()[:16]
+    state_digest = hashlib.sha1(state_key.encode()).hexdigest()[:16]
+    return CACHE_DIR / f"config-{path_digest}-{state_digest}.pickle"
+
+
+def _read_cached(cache_path: Path) -> Config | None:
+    """Load cached Config or None if missing/corrupt."""
+    import pickle
+
+    try:
+        with open(cache_path, "rb") as f:
+            config = pickle.load(f)
+    except Exception:
+        return None
+    return config if isinstance(config, Config) else None
+
+
+def _write_cached(cache_path: Path, config: Config) -> None:
+    """
+    Store Config in cache atomically (tmp + rename), ignoring errors.
+
+    Older entries for the same config file are removed.
+    """
+    import pickle
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(config, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        return
+
+    path_prefix = cache_path.name.rsplit("-", 1)[0]
+    for stale in cache_path.parent.glob(f"{path_prefix}-*.pickle"):
+        if stale != cache_path:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+
+
 def load_config(repo_root: Path | None = None) -> Config:
-    """Load configuration from file or return defaults."""
+    """
+    Load configuration from file or return defaults.
+
+    Parsed config is cached under ~/.cache/wtr keyed by file path, mtime,
+    size and wtr version, so repeated calls (e.g. from shell completion) skip TOML parsing.
+    TOML and cache modules are only imported when a config file exists.
+    """
     config_path = find_config_file(repo_root)
 
     if config_path is None:
         return Config()
 
+    try:
+        cache_path = _cache_path(config_path)
+    except OSError:
+        cache_path = None
+    else:
+        cached = _read_cached(cache_path)
+        if cached is not None:
+            return cached
+
+    config = _parse_config(config_path)
+    if config is None:
+        return Config()
+
+    if cache_path is not None:
+        _write_cached(cache_path, config)
+    return config
+
+
+def _parse_config(config_path: Path) -> Config | None:
+    """Parse TOML config file, returns None if unreadable."""
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        import tomli as tomllib
+
     try:
         with open(config_path, "rb") as f:
             data = tomllib.load(f)
     except Exception:
-        return Config()
+        return None
 
     config = Config()
 
@@ -1,34 +1,43 @@
 """Fuzzy search helpers for branch filtering."""
 
-from thefuzz import fuzz
-
 
 def is_subsequence(query: str, text: str) -> bool:
     """Check if query is a subsequence of text (chars in order, not necessarily adjacent)."""
-    it = iter(text)
-    return all(char in it for char in query)
+    # str.find scans in C, so Python-level work is O(len(query))
+    pos = -1
+    for char in query:
+        pos = text.find(char, pos + 1)
+        if pos < 0:
+            return False
+    return True
 
 
 def fuzzy_filter(
     items: list[str],
     query: str,
     threshold: int = 95,
+    items_lower: list[str] | None = None,
 ) -> list[tuple[str, int]]:
     """
     Filter items by fuzzy matching against query.
 
     Returns list of (item, score) tuples sorted by score descending.
     Only items with score >= threshold are returned.
+    items_lower may hold precomputed lowercase items (parallel to items)
+    to avoid lowercasing on every call when filtering repeatedly.
     """
     if not query:
         return [(item, 100) for item in items]
 
     query_lower = query.lower()
     results = []
+    rest: list[str] = []  # items left for fuzzy scoring
+    rest_lower: list[str] = []
 
-    for item in items:
-        item_lower = item.lower()
+    if items_lower is None:
+        items_lower = [item.lower() for item in items]
 
+    for item, item_lower in zip(items, items_lower):
         # Exact substring match gets highest priority
         if query_lower in item_lower:
             results.append((item, 100))
@@ -39,15 +48,12 @@ def fuzzy_filter(
             results.append((item, 95))
             continue
 
-        # Fuzzy match using partial ratio for substring-like matching
-        score = fuzz.partial_ratio(query_lower, item_lower)
-
-        # Also consider token sort for multi-word queries
-        token_score = fuzz.token_sort_ratio(query_lower, item_lower)
-        score = max(score, token_score)
+        rest.append(item)
+        rest_lower.append(item_lower)
 
-        if score >= threshold:
-            results.append((item, score))
+    if rest:
+        scores = _fuzzy_scores(query_lower, rest_lower, threshold)
+        results.extend((rest[i], score) for i, score in scores.items())
 
     # Sort by score descending, then alphabetically
     results.sort(key=lambda x: (-x[1], x[0]))
@@ -55,10 +61,126 @@ def fuzzy_filter(
     return results
 
 
-def fuzzy_match(items: list[str], query: str, threshold: int = 95) -> list[str]:
+def _fuzzy_scores(
+    query: str,
+    choices: list[str],
+    threshold: int,
+    processed: list[str] | None = None,
+) -> dict[int, int]:
+    """
+    Score choices against query with rapidfuzz in batch.
+
+    Score is max of partial ratio (substring-like matching) and token sort
+    (multi-word queries). Returns {choice index: score} for scores >= threshold.
+    processed may hold default_process(choice) for each choice, computed once
+    by callers that score the same items repeatedly.
+    """
+    # rapidfuzz is imported lazily: substring/subsequence hits never need it
+    from rapidfuzz import fuzz, process, utils
+
+    if processed is None:
+        token_args = (query, choices, utils.default_process)
+    else:
+        token_args = (utils.default_process(query), processed, None)
+
+    scores: dict[int, int] = {}
+    for scorer, (scored_query, scored_choices, processor) in (
+        (fuzz.partial_ratio, (query, choices, None)),
+        (fuzz.token_sort_ratio, token_args),
+    ):
+        matches = process.extract(
+            scored_query,
+            scored_choices,
+            scorer=scorer,
+            processor=processor,
+            # Scores are rounded below, keep anything that may round up
+            score_cutoff=threshold - 0.5,
+            limit=None,
+        )
+        for _, score, index in matches:
+            score = round(score)
+            if score >= threshold:
+                scores[index] = max(scores.get(index, 0), score)
+
+    return scores
+
+
+def fuzzy_match(
+    items: list[str],
+    query: str,
+    threshold: int = 95,
+    items_lower: list[str] | None = None,
+) -> list[str]:
     """
     Filter items by fuzzy matching, returning only item names.
 
     Convenience wrapper around fuzzy_filter.
     """
-    return [item for item, _ in fuzzy_filter(items, query, threshold)]
+    return [item for item, _ in fuzzy_filter(items, query, threshold, items_lower)]
+
+
+class IncrementalMatcher:
+    """
+    fuzzy_match over a fixed item list, reusing work while a query is typed.
+
+    Any item that contains "abc" (as substring or subsequence) also contains
+    "ab", so when the new query extends the previous one only the previous
+    substring/subsequence hits need those checks. All other items go
+    straight to batch fuzzy scoring, whose results are not monotonic.
+    match() returns the same list as fuzzy_match(items, query).
+    """
+
+    def __init__(self, items: list[str], threshold: int = 95):
+        self.items = items
+        self.threshold = threshold
+        self._items_lower = [item.lower() for item in items]
+        # rapidfuzz default_process of each item, built on first fuzzy scoring
+        self._items_processed: list[str] | None = None
+        # Lowercased previous query and indices of its substring/subsequence hits
+        self._query = ""
+        self._hits: list[int] = []
+
+    def match(self, query: str) -> list[str]:
+        """Filter items by query (see fuzzy_filter for scoring and order)."""
+        if not query:
+            self._query = ""
+            return list(self.items)
+
+        query_lower = query.lower()
+        items, items_lower = self.items, self._items_lower
+        if self._query and query_lower.startswith(self._query):
+            candidates = self._hits
+        else:
+            candidates = range(len(items))
+
+        results = []
+        hits = []
+        for i in candidates:
+            item_lower = items_lower[i]
+            if query_lower in item_lower:
+                results.append((items[i], 100))
+            elif is_subsequence(query_lower, item_lower):
+                results.append((items[i], 95))
+            else:
+                continue
+            hits.append(i)
+
+        hit_set = set(hits)
+        rest = [i for i in range(len(items)) if i not in hit_set]
+        if rest:
+            if self._items_processed is None:
+                from rapidfuzz import utils
+                self._items_processed = [utils.default_process(item) for item in items_lower]
+            processed = self._items_processed
+            scores = _fuzzy_scores(
+                query_lower,
+                [items_lower[i] for i in rest],
+                self.threshold,
+                [processed[i] for i in rest],
+            )
+            results.extend((items[rest[j]], score) for j, score in scores.items())
+
+        results.sort(key=lambda x: (-x[1], x[0]))
+        self._query = query_lower
+        self._hits = hits
+        return [item for item, _ in results]
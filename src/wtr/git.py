@@ -1,13 +1,32 @@
 """Git operations for worktree management."""
 
+import os
+import re
 import shutil
+import subprocess
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
-from git import Repo, InvalidGitRepositoryError
+from git import Repo, InvalidGitRepositoryError, NoSuchPathError
 from git.exc import GitCommandError
 
+# Parses ahead/behind counts from for-each-ref %(upstream:track)
+TRACK_AHEAD_RE = re.compile(r"ahead (\d+)")
+TRACK_BEHIND_RE = re.compile(r"behind (\d+)")
+
+# git worktree add errors meaning the requested commit does not exist
+UNKNOWN_COMMIT_RE = re.compile(r"invalid reference|not a valid object name|unknown revision")
+
+# Max concurrent 'git status' calls when collecting branch statuses
+STATUS_WORKERS = 8
+
+# Max concurrent 'git worktree remove' calls when pruning
+DELETE_WORKERS = 8
+
 
 @dataclass
 class BranchStatus:
@@ -41,16 +60,39 @@ class GitWorktreeManager:
         self.root = Path(self.repo.working_dir)
         # Container is parent directory where worktrees live side by side
         self.container = self.root.parent
+        # Cached list_* results, reset by _invalidate() on mutations
+        self._worktrees: dict[str, Path] | None = None
+        self._branches: list[str] | None = None
+        self._tags: list[str] | None = None
+        self._worktree_list: list[tuple[Path, str | None]] | None = None
+        # Main branch doesn't change during a run, resolve it once
+        self._main_branch: str | None = None
+        # Raw contents of the main repo's HEAD file
+        self._head: str | None = None
 
     def _find_repo(self, path: Path) -> Repo:
         """Find git repository from path, walking up if needed."""
+        root = path.resolve()
+        for candidate in (root, *root.parents):
+            # .git is a directory in a regular clone, a file in a worktree
+            if (candidate / ".git").exists():
+                break
+        else:
+            raise RuntimeError(f"Not a git repository: {path}")
+
         try:
-            return Repo(path, search_parent_directories=True)
-        except InvalidGitRepositoryError:
+            return Repo(candidate)
+        except (InvalidGitRepositoryError, NoSuchPathError):
             raise RuntimeError(f"Not a git repository: {path}")
 
     def get_main_branch(self) -> str:
         """Determine main branch name from origin/HEAD or fallback to main/master."""
+        if self._main_branch is None:
+            self._main_branch = self._detect_main_branch()
+        return self._main_branch
+
+    def _detect_main_branch(self) -> str:
+        """Resolve main branch name (uncached)."""
         # Try to get from origin/HEAD
         try:
             ref = self.repo.git.symbolic_ref("refs/remotes/origin/HEAD", short=True)
@@ -61,7 +103,7 @@ class GitWorktreeManager:
             pass
 
         # Fallback: check if main/master exists
-        branches = [b.name for b in self.repo.branches]
+        branches = self.list_local_branches()
         if "main" in branches:
             return "main"
         if "master" in branches:
@@ -157,16 +199,27 @@ class GitWorktreeManager:
         self.repo = Repo(new_root)
         self.root = new_root
         self.container = new_container
+        self._invalidate()
 
         return new_root
 
     def list_local_branches(self) -> list[str]:
-        """List all local branch names."""
-        return sorted([b.name for b in self.repo.branches])
+        """List all local branch names (cached until next mutation)."""
+        if self._branches is None:
+            self._branches = self._list_refs("refs/heads/")
+        return list(self._branches)
 
     def list_tags(self) -> list[str]:
-        """List all tag names."""
-        return sorted([t.name for t in self.repo.tags])
+        """List all tag names (cached until next mutation)."""
+        if self._tags is None:
+            self._tags = self._list_refs("refs/tags/")
+        return list(self._tags)
+
+    def _list_refs(self, prefix: str) -> list[str]:
+        """Sorted ref names under prefix (e.g. "refs/heads/") from one for-each-ref."""
+        # Full refname, not :short, which turns into "heads/x" on name clashes
+        output = self.repo.git.for_each_ref("--format=%(refname)", prefix)
+        return sorted(line[len(prefix):] for line in output.splitlines() if line)
 
     def resolve_commit(self, commit_ish: str) -> str | None:
         """
@@ -190,7 +243,24 @@ class GitWorktreeManager:
 
         For regular worktrees, name is the branch name.
         For detached HEAD worktrees, name is the directory name.
+        Result is cached until a worktree is created, deleted or restructured.
         """
+        # Read the attribute once: a removal in a worker thread may reset it
+        worktrees = self._worktrees
+        if worktrees is None:
+            worktrees = self._worktrees = self._scan_worktrees()
+        return dict(worktrees)
+
+    def _invalidate(self) -> None:
+        """Drop cached worktree, branch and tag lists and HEAD."""
+        self._worktrees = None
+        self._branches = None
+        self._tags = None
+        self._worktree_list = None
+        self._head = None
+
+    def _scan_worktrees(self) -> dict[str, Path]:
+        """Collect worktrees in container from one 'git worktree list'."""
         worktrees = {}
 
         # Worktrees are sibling directories in container
@@ -203,28 +273,50 @@ class GitWorktreeManager:
         if main_repo_path.exists():
             worktrees[main_branch] = main_repo_path
 
-        for item in self.container.iterdir():
-            if not item.is_dir():
+        # git reports resolved paths, compare against resolved container
+        container_real = self.container.resolve()
+        main_repo_real = main_repo_path.resolve()
+
+        for path, branch in self.get_worktree_list_raw():
+            # Skip main repo directory (already added) and worktrees elsewhere
+            if path == main_repo_real or path.parent != container_real:
                 continue
-            # Skip main repo directory (already added)
-            if item == main_repo_path:
+            item = self.container / path.name
+            if not item.is_dir():
+                # Stale entry, directory was removed
                 continue
-            # Check if it's a git worktree (.git file, not directory)
-            git_path = item / ".git"
-            if git_path.is_file():
-                try:
-                    wt_repo = Repo(item)
-                    if wt_repo.head.is_detached:
-                        # Detached HEAD - use directory name as key
-                        worktrees[item.name] = item
-                    else:
-                        branch_name = wt_repo.active_branch.name
-                        worktrees[branch_name] = item
-                except Exception:
-                    # Directory exists but not a valid worktree
-                    pass
+            # Detached HEAD - use directory name as key
+            worktrees[branch or item.name] = item
         return worktrees
 
+    def find_worktree(self, name: str) -> Path | None:
+        """
+        Find worktree path by name (same keys as list_worktrees).
+
+        Checks the conventional location (container/name) first, so the
+        common case doesn't open every worktree. Falls back to a full scan.
+        """
+        if name == self.get_main_branch():
+            main_repo_path = self.get_main_repo_path()
+            if main_repo_path.exists():
+                return main_repo_path
+        else:
+            path = self.get_worktree_path(name)
+            if (path / ".git").is_file():
+                try:
+                    head = self._worktree_head(path)
+                except OSError:
+                    head = ""
+                if head.startswith("refs/heads/"):
+                    key = head.removeprefix("refs/heads/")
+                else:
+                    # Detached HEAD - keyed by directory name
+                    key = path.name
+                if key == name:
+                    return path
+
+        return self.list_worktrees().get(name)
+
     def branch_exists(self, name: str) -> bool:
         """Check if local branch exists."""
         return name in self.list_local_branches()
@@ -276,11 +368,7 @@ class GitWorktreeManager:
 
         try:
             if commit:
-                # Verify commit exists
-                resolved = self.resolve_commit(commit)
-                if not resolved:
-                    raise RuntimeError(f"Commit '{commit}' not found")
-
+                # worktree add validates the commit itself, see except below
                 if create_branch:
                     # Create new branch from commit
                     self.repo.git.worktree("add", "-b", name, str(worktree_path), commit)
@@ -295,7 +383,11 @@ class GitWorktreeManager:
                 base = base_branch or self.get_main_branch()
                 self.repo.git.worktree("add", "-b", name, str(worktree_path), base)
         except GitCommandError as e:
+            if commit and UNKNOWN_COMMIT_RE.search(str(e.stderr)):
+                raise RuntimeError(f"Commit '{commit}' not found")
             raise RuntimeError(f"Failed to create worktree: {e}")
+        finally:
+            self._invalidate()
 
         return worktree_path
 
@@ -309,13 +401,23 @@ class GitWorktreeManager:
         worktree_path = worktrees[branch]
 
         try:
-            # Remove from git
-            self.repo.git.worktree("remove", str(worktree_path), "--force")
-        except GitCommandError as e:
+            self._remove_worktree(worktree_path)
+        except (GitCommandError, OSError) as e:
             raise RuntimeError(f"Failed to delete worktree: {e}")
+        finally:
+            self._invalidate()
 
     def get_current_branch(self) -> str | None:
         """Get current branch name or None if detached."""
+        if self._head is None:
+            self._head = (Path(self.repo.git_dir) / "HEAD").read_text().strip()
+        head = self._head
+        if head.startswith("ref: refs/heads/"):
+            return head[16:]
+        if not head.startswith("ref:"):
+            return None  # detached: HEAD holds a commit SHA
+
+        # Unusual symbolic ref, let GitPython resolve it
         if self.repo.head.is_detached:
             return None
         return self.repo.active_branch.name
@@ -327,25 +429,30 @@ class GitWorktreeManager:
         Returns:
             List of (path, branch_name) tuples. branch_name is None for detached HEAD.
         """
+        if self._worktree_list is None:
+            self._worktree_list = self._parse_worktree_list()
+        return list(self._worktree_list)
+
+    def _parse_worktree_list(self) -> list[tuple[Path, str | None]]:
+        """Run 'git worktree list --porcelain' and parse it (uncached)."""
         result = []
         try:
             output = self.repo.git.worktree("list", "--porcelain")
-            current_path = None
-
-            for line in output.split("\n"):
-                if line.startswith("worktree "):
-                    current_path = Path(line[9:])
-                elif line.startswith("branch refs/heads/"):
-                    branch = line[18:]  # strip "branch refs/heads/"
-                    if current_path:
-                        result.append((current_path, branch))
-                        current_path = None
-                elif line == "detached":
-                    if current_path:
-                        result.append((current_path, None))
-                        current_path = None
         except Exception:
-            pass
+            return result
+
+        # One blank-line separated block per worktree, one "<key> <value>"
+        # field per line; flags like "detached" or "bare" have no value
+        for block in output.split("\n\n"):
+            fields = dict(line.partition(" ")[::2] for line in block.splitlines())
+            if "worktree" not in fields:
+                continue
+            branch = fields.get("branch", "")
+            if branch.startswith("refs/heads/"):
+                result.append((Path(fields["worktree"]), branch[11:]))
+            elif "detached" in fields:
+                result.append((Path(fields["worktree"]), None))
+            # Bare entries have neither and are skipped
 
         return result
 
@@ -369,113 +476,310 @@ class GitWorktreeManager:
         """Check if there are multiple worktrees (more than just main repo)."""
         return len(self.get_worktree_list_raw()) > 1
 
+    def get_branch_commit_times(self, branches: list[str]) -> dict[str, datetime]:
+        """
+        Get last commit time for each local branch from one for-each-ref.
+
+        Branches that don't exist are left out of the result.
+        """
+        if not branches:
+            return {}
+        try:
+            output = self.repo.git.for_each_ref(
+                "--format=%(refname) %(committerdate:unix)",
+                *[f"refs/heads/{branch}" for branch in branches],
+            )
+        except Exception:
+            return {}
+
+        # Patterns also match refs below them (refs/heads/a/b for "a"), keep exact names
+        wanted = set(branches)
+        times = {}
+        for line in output.splitlines():
+            ref, _, timestamp = line.rpartition(" ")
+            name = ref.removeprefix("refs/heads/")
+            if name in wanted and timestamp:
+                times[name] = datetime.fromtimestamp(int(timestamp))
+        return times
+
     def get_branch_status(self, branch: str) -> BranchStatus:
         """Get detailed status for a branch."""
         status = BranchStatus()
 
-        # Find the repo to check - either worktree or main repo
+        # Find the worktree to check - linked worktree or main repo
         worktrees = self.list_worktrees()
         if branch in worktrees:
-            try:
-                repo = Repo(worktrees[branch])
-            except Exception:
-                return status
+            path = worktrees[branch]
         elif branch == self.get_current_branch():
-            repo = self.repo
+            path = self.root
         else:
             # Branch exists but no worktree - get last commit time only
-            try:
-                branch_ref = self.repo.heads[branch]
-                status.last_commit_time = datetime.fromtimestamp(
-                    branch_ref.commit.committed_date
-                )
-            except Exception:
-                pass
+            status.last_commit_time = self.get_branch_commit_times([branch]).get(branch)
             return status
 
-        # Check dirty status
-        status.dirty = repo.is_dirty(untracked_files=False)
+        # Worktree HEAD: "refs/heads/<branch>" or commit SHA if detached
+        try:
+            head = self._worktree_head(path)
+        except OSError:
+            return status
 
-        # Count untracked files
-        status.untracked_count = len(repo.untracked_files)
+        # Check dirty status and count untracked files
+        status.dirty, status.untracked_count = self._worktree_changes(path)
 
+        # Refs and config are shared, so the rest is read via the main repo
         # Check ahead/behind
         try:
-            branch_ref = repo.active_branch
-            tracking = branch_ref.tracking_branch()
-            if tracking:
-                ahead = len(list(repo.iter_commits(f"{tracking}..{branch_ref}")))
-                behind = len(list(repo.iter_commits(f"{branch_ref}..{tracking}")))
-                status.ahead = ahead
-                status.behind = behind
+            if head.startswith("refs/heads/"):
+                branch_ref = self.repo.heads[head.removeprefix("refs/heads/")]
+                tracking = branch_ref.tracking_branch()
+                if tracking:
+                    # One rev-list call, output is "<behind>\t<ahead>"
+                    counts = self.repo.git.rev_list(
+                        "--left-right", "--count", f"{tracking}...{branch_ref}"
+                    )
+                    behind, ahead = counts.split()
+                    status.ahead = int(ahead)
+                    status.behind = int(behind)
         except Exception:
             pass
 
         # Last commit time
         try:
             status.last_commit_time = datetime.fromtimestamp(
-                repo.head.commit.committed_date
+                self.repo.commit(head).committed_date
             )
         except Exception:
             pass
 
         # Check for stash
-        try:
-            stash_list = repo.git.stash("list")
-            status.has_stash = bool(stash_list.strip())
-        except Exception:
-            pass
+        status.has_stash = self.has_stash()
 
-        # Check rebase in progress
-        git_dir = Path(repo.git_dir)
-        status.rebase_in_progress = (
-            (git_dir / "rebase-merge").exists()
-            or (git_dir / "rebase-apply").exists()
+        # Check rebase/merge in progress
+        status.rebase_in_progress, status.merge_in_progress = (
+            self._operations_in_progress(path)
         )
 
-        # Check merge in progress
-        status.merge_in_progress = (git_dir / "MERGE_HEAD").exists()
-
         return status
 
+    def has_stash(self) -> bool:
+        """
+        Check if repository has stashed changes, without spawning git.
+
+        refs/stash exists (loose or packed) exactly when the stash is not
+        empty. The stash is shared by all worktrees.
+        """
+        common_dir = Path(self.repo.common_dir)
+        if (common_dir / "refs" / "stash").exists():
+            return True
+        try:
+            with open(common_dir / "packed-refs") as f:
+                return any(line.rstrip().endswith(" refs/stash") for line in f)
+        except OSError:
+            return False
+
+    def get_all_branch_statuses(
+        self, branches: list[str] | None = None
+    ) -> dict[str, BranchStatus]:
+        """
+        Get status for many branches (default: all local) with batched git calls.
+
+        Same result as get_branch_status per branch, but commit times and
+        ahead/behind come from one for-each-ref and stash presence is checked
+        once. Only dirty/untracked/rebase/merge checks run per worktree.
+        """
+        if branches is None:
+            branches = self.list_local_branches()
+        worktrees = self.list_worktrees()
+        current_branch = self.get_current_branch()
+
+        # refname -> (commit time, upstream track) in one subprocess
+        refs: dict[str, tuple[datetime | None, str]] = {}
+        try:
+            output = self.repo.git.for_each_ref(
+                "--format=%(refname) %(committerdate:unix) %(upstream:track)",
+                "refs/heads",
+            )
+        except GitCommandError:
+            output = ""
+        for line in output.splitlines():
+            refname, _, rest = line.partition(" ")
+            timestamp, _, track = rest.partition(" ")
+            commit_time = datetime.fromtimestamp(int(timestamp)) if timestamp else None
+            refs[refname.removeprefix("refs/heads/")] = (commit_time, track)
+
+        # Stash is shared by all worktrees of the repository
+        has_stash = self.has_stash()
+
+        statuses = {}
+        status_paths: dict[str, Path] = {}  # worktrees needing git status
+        for branch in branches:
+            if branch in worktrees:
+                repo_path = worktrees[branch]
+            elif branch == current_branch:
+                repo_path = self.root
+            else:
+                # Branch exists but no worktree - last commit time only
+                status = BranchStatus()
+                if branch in refs:
+                    status.last_commit_time = refs[branch][0]
+                statuses[branch] = status
+                continue
+
+            if branch not in refs:
+                # Detached worktree (keyed by directory name)
+                statuses[branch] = self.get_branch_status(branch)
+                continue
+
+            commit_time, track = refs[branch]
+            ahead = TRACK_AHEAD_RE.search(track)
+            behind = TRACK_BEHIND_RE.search(track)
+
+            rebase, merge = self._operations_in_progress(repo_path)
+            statuses[branch] = BranchStatus(
+                ahead=int(ahead.group(1)) if ahead else 0,
+                behind=int(behind.group(1)) if behind else 0,
+                last_commit_time=commit_time,
+                has_stash=has_stash,
+                rebase_in_progress=rebase,
+                merge_in_progress=merge,
+            )
+            status_paths[branch] = repo_path
+
+        # git status per worktree is independent I/O, run them concurrently
+        if status_paths:
+            workers = min(STATUS_WORKERS, len(status_paths))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                changes = executor.map(self._worktree_changes, status_paths.values())
+                for branch, (dirty, untracked_count) in zip(status_paths, changes):
+                    statuses[branch].dirty = dirty
+                    statuses[branch].untracked_count = untracked_count
+
+        return statuses
+
+    def _worktree_changes(self, path: Path) -> tuple[bool, int]:
+        """
+        Get (dirty, untracked_count) for a worktree from one git status call.
+
+        Dirty means tracked changes, staged or not (untracked files excluded).
+        Runs git directly: cheaper than GitPython and safe to call from threads.
+        """
+        try:
+            output = self._git(path, "status", "--porcelain=v1", "-uall")
+        except (GitCommandError, OSError):
+            return False, 0
+
+        dirty = False
+        untracked_count = 0
+        for line in output.splitlines():
+            if line.startswith("??"):
+                untracked_count += 1
+            elif line:
+                dirty = True
+        return dirty, untracked_count
+
+    def _git(self, path: Path, *args: str) -> str:
+        """
+        Run git in worktree at path and return stdout.
+
+        Avoids constructing a Repo per worktree. Raises GitCommandError on failure.
+        """
+        command = ["git", "-C", str(path), *args]
+        result = subprocess.run(command, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise GitCommandError(command, result.returncode, result.stderr)
+        return result.stdout
+
+    def _worktree_git_dir(self, path: Path) -> Path:
+        """Get git dir of worktree at path by reading .git (no subprocess)."""
+        git_path = path / ".git"
+        if git_path.is_file():
+            # Linked worktree: .git file contains "gitdir: <path>"
+            gitdir = git_path.read_text().strip().removeprefix("gitdir:").strip()
+            return path / gitdir
+        return git_path
+
+    def _remove_worktree(self, path: Path) -> None:
+        """
+        Remove linked worktree at path, like 'git worktree remove --force'.
+
+        A plain linked worktree is removed by deleting its directory and its
+        admin dir under .git/worktrees, without starting git. Anything else
+        (main or locked worktree, submodules, missing directory, delete
+        failure) goes through git, which removes it or reports why it can't.
+        Raises GitCommandError, or OSError if git itself cannot be started.
+        """
+        worktrees_dir = Path(self.repo.common_dir).resolve() / "worktrees"
+        try:
+            admin_dir = self._worktree_git_dir(path).resolve()
+            fast = (
+                admin_dir.parent == worktrees_dir
+                and admin_dir.is_dir()
+                and not (admin_dir / "locked").exists()
+                and not (path / ".gitmodules").exists()
+            )
+            if fast:
+                shutil.rmtree(path)
+        except OSError:
+            fast = False
+
+        if not fast:
+            self._git(self.root, "worktree", "remove", str(path), "--force")
+            return
+        shutil.rmtree(admin_dir, ignore_errors=True)
+
+    def _worktree_head(self, path: Path) -> str:
+        """Read worktree HEAD: "refs/heads/<branch>" or commit SHA if detached."""
+        head = (self._worktree_git_dir(path) / "HEAD").read_text().strip()
+        return head.removeprefix("ref: ")
+
+    def _operations_in_progress(self, path: Path) -> tuple[bool, bool]:
+        """Get (rebase_in_progress, merge_in_progress) for worktree at path."""
+        git_dir = self._worktree_git_dir(path)
+        rebase = (git_dir / "rebase-merge").exists() or (git_dir / "rebase-apply").exists()
+        merge = (git_dir / "MERGE_HEAD").exists()
+        return rebase, merge
+
     def get_recent_commits(self, branch: str, count: int = 5) -> list[CommitInfo]:
-        """Get recent commits for a branch."""
+        """Get recent commits for a branch (tip first)."""
         commits = []
         try:
-            branch_ref = self.repo.heads[branch]
-            for commit in list(branch_ref.commit.iter_parents())[:count]:
-                commits.append(
-                    CommitInfo(
-                        sha=commit.hexsha[:7],
-                        message=commit.message.split("\n")[0][:60],
-                        time=datetime.fromtimestamp(commit.committed_date),
-                    )
-                )
-            # Include the branch tip commit itself
-            tip = branch_ref.commit
-            commits.insert(
-                0,
-                CommitInfo(
-                    sha=tip.hexsha[:7],
-                    message=tip.message.split("\n")[0][:60],
-                    time=datetime.fromtimestamp(tip.committed_date),
-                ),
+            # Bounded output from one git log call, fields separated by \x01
+            output = self.repo.git.log(
+                f"-n{count}",
+                "--format=%H%x01%ct%x01%s",
+                f"refs/heads/{branch}",
+                "--",
             )
-            commits = commits[:count]
         except Exception:
-            pass
+            return commits
+
+        for line in output.splitlines():
+            sha, timestamp, subject = line.split("\x01", 2)
+            commits.append(
+                CommitInfo(
+                    sha=sha[:7],
+                    message=subject[:60],
+                    time=datetime.fromtimestamp(int(timestamp)),
+                )
+            )
         return commits
 
     def is_branch_merged(self, branch: str, into: str | None = None) -> bool:
         """Check if branch is merged into target branch."""
+        return branch in self.list_merged_branches(into)
+
+    def list_merged_branches(self, into: str | None = None) -> set[str]:
+        """Get local branches merged into target branch (one git call)."""
         target = into or self.get_main_branch()
         try:
-            # Check if branch commit is ancestor of target
-            branch_commit = self.repo.heads[branch].commit
-            target_commit = self.repo.heads[target].commit
-            return self.repo.is_ancestor(branch_commit, target_commit)
-        except Exception:
-            return False
+            output = self.repo.git.for_each_ref(
+                "--merged", f"refs/heads/{target}",
+                "--format=%(refname)",
+                "refs/heads",
+            )
+        except GitCommandError:
+            return set()
+        return {line.removeprefix("refs/heads/") for line in output.splitlines()}
 
     def find_stale_worktrees(self) -> list[tuple[str, str]]:
         """
@@ -488,6 +792,7 @@ class GitWorktreeManager:
         worktrees = self.list_worktrees()
         local_branches = set(self.list_local_branches())
         main_branch = self.get_main_branch()
+        merged = self.list_merged_branches(main_branch)
 
         for branch in worktrees:
             # Check if branch was deleted
@@ -496,25 +801,54 @@ class GitWorktreeManager:
                 continue
 
             # Check if merged to main (skip main itself)
-            if branch != main_branch and self.is_branch_merged(branch, main_branch):
+            if branch != main_branch and branch in merged:
                 stale.append((branch, f"merged to {main_branch}"))
 
         return stale
 
-    def prune_worktrees(self, branches: list[str]) -> dict[str, str | None]:
+    def prune_worktrees(
+        self,
+        branches: list[str],
+        on_progress: Callable[[str, int, int], None] | None = None,
+    ) -> dict[str, str | None]:
         """
         Delete multiple worktrees.
 
+        on_progress, if given, is called as (branch, done, total) after each
+        removal finishes, from the calling thread.
         Returns dict of {branch: error_message or None}.
         """
+        worktrees = self.list_worktrees()
         results = {}
+        paths = {}
         for branch in branches:
+            if branch in worktrees:
+                paths[branch] = worktrees[branch]
+            else:
+                results[branch] = f"No worktree for branch: {branch}"
+
+        # Removals touch disjoint directories, run them concurrently
+        if paths:
             try:
-                self.delete_worktree(branch)
-                results[branch] = None
-            except RuntimeError as e:
-                results[branch] = str(e)
-        return results
+                workers = min(DELETE_WORKERS, len(paths))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = {
+                        executor.submit(self._remove_worktree, path): branch
+                        for branch, path in paths.items()
+                    }
+                    for done, future in enumerate(as_completed(futures), 1):
+                        branch = futures[future]
+                        try:
+                            future.result()
+                            results[branch] = None
+                        except (GitCommandError, OSError) as e:
+                            results[branch] = f"Failed to delete worktree: {e}"
+                        if on_progress is not None:
+                            on_progress(branch, done, len(futures))
+            finally:
+                self._invalidate()
+
+        return {branch: results[branch] for branch in branches}
 
     def get_uncommitted_files(self, branch: str) -> list[str]:
         """
@@ -526,33 +860,51 @@ class GitWorktreeManager:
         if branch not in worktrees:
             # Check if it's the current branch in main repo
             if branch == self.get_current_branch():
-                repo = self.repo
+                path = self.root
             else:
                 return []
         else:
-            try:
-                repo = Repo(worktrees[branch])
-            except Exception:
-                return []
+            path = worktrees[branch]
 
-        files = []
+        try:
+            output = self._git(path, "status", "--porcelain=v1", "-uall", "-z")
+        except (GitCommandError, OSError):
+            return []
+
+        # Staged, unstaged and untracked files. With -z, each entry is
+        # "XY <path>"; renames/copies are followed by the original path
+        files = set()
+        entries = iter(output.split("\0"))
+        for entry in entries:
+            if not entry:
+                continue
+            files.add(entry[3:])
+            if entry[0] in "RC":
+                next(entries, None)
 
-        # Modified files (staged and unstaged)
-        for item in repo.index.diff(None):
-            files.append(item.a_path)
+        return sorted(files)
 
-        # Staged files
-        for item in repo.index.diff("HEAD"):
-            if item.a_path not in files:
-                files.append(item.a_path)
 
-        # Untracked files
-        files.extend(repo.untracked_files)
+SHARE_OBJ_FILENAME = "share_obj.yaml"
 
-        return sorted(set(files))
 
+def _scan_names(directory: Path) -> set[str]:
+    """Return entry names in directory (empty if it cannot be read)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
 
-SHARE_OBJ_FILENAME = "share_obj.yaml"
+
+@lru_cache(maxsize=8)
+def _load_share_obj(path_str: str, mtime_ns: int) -> dict:
+    """Parse share_obj.yaml; mtime_ns in the key drops stale entries."""
+    import yaml
+    # C loader is much faster when PyYAML was built against libyaml
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path_str) as f:
+        return yaml.load(f, Loader=loader) or {}
 
 
 def create_shared_symlinks(worktree_path: Path, container: Path) -> list[str]:
@@ -569,18 +921,19 @@ def create_shared_symlinks(worktree_path: Path, container: Path) -> list[str]:
     warnings = []
     share_obj_file = container / SHARE_OBJ_FILENAME
 
-    if not share_obj_file.exists():
+    try:
+        mtime_ns = share_obj_file.stat().st_mtime_ns
+    except FileNotFoundError:
         return warnings
 
     try:
-        import yaml
-        with open(share_obj_file) as f:
-            share_obj = yaml.safe_load(f) or {}
+        share_obj = _load_share_obj(str(share_obj_file), mtime_ns)
     except Exception as e:
         warnings.append(f"Failed to read {SHARE_OBJ_FILENAME}: {e}")
         return warnings
 
     worktree_name = worktree_path.name
+    made_dirs: set[tuple[str, ...]] = set()
 
     for source_dir, items in share_obj.items():
         # Skip if source is the worktree itself
@@ -592,29 +945,36 @@ def create_shared_symlinks(worktree_path: Path, container: Path) -> list[str]:
             continue
 
         source_path = container / source_dir
+        # Entry names per source subdirectory, each scanned once
+        present: dict[tuple[str, ...], set[str]] = {}
 
         for item in items:
-            symlink_path = worktree_path / item
-
-            # Calculate depth: count path components in item
-            item_path = Path(item)
-            depth = len(item_path.parts) - 1  # -1 because last part is file/dir itself
+            parts = Path(item).parts
+            depth = len(parts) - 1  # -1 because last part is file/dir itself
 
             # Build relative path with correct number of ..
             # depth=0 (root file) needs 1 "..", depth=1 (one subdir) needs 2 "..", etc.
-            rel_prefix = Path(*[".."] * (depth + 1))
-            target = rel_prefix / source_dir / item
+            target = os.path.join(*[".."] * (depth + 1), source_dir, *parts)
 
             # Check if source exists (warning only, still create symlink)
-            item_source_path = source_path / item
-            if not item_source_path.exists():
+            parent_parts = parts[:-1]
+            names = present.get(parent_parts)
+            if names is None:
+                names = present[parent_parts] = _scan_names(
+                    source_path.joinpath(*parent_parts)
+                )
+            if parts[-1] not in names:
                 warnings.append(f"Source does not exist: {source_dir}/{item}")
 
+            symlink_path = os.path.join(worktree_path, *parts)
+
             # Create parent directories if needed
-            symlink_path.parent.mkdir(parents=True, exist_ok=True)
+            if parent_parts and parent_parts not in made_dirs:
+                os.makedirs(os.path.dirname(symlink_path), exist_ok=True)
+                made_dirs.add(parent_parts)
 
             try:
-                symlink_path.symlink_to(target)
+                os.symlink(target, symlink_path)
             except OSError as e:
                 warnings.append(f"Failed to create symlink {item}: {e}")
 
@@ -1,13 +1,17 @@
 """TUI interface for worktree manager."""
 
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
 from pathlib import Path
+from typing import TypeVar
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
 from textual.screen import ModalScreen
+from textual.timer import Timer
 from textual.widgets import (
     Button,
     Checkbox,
@@ -21,57 +25,88 @@ from textual.widgets import (
 )
 
 from .config import Config, load_config
-from .fuzzy import fuzzy_match
+from .fuzzy import IncrementalMatcher
 from .git import BranchStatus, GitWorktreeManager, create_shared_symlinks
 
 
-def format_time_ago(dt: datetime | None) -> str:
-    """Format datetime as relative time string."""
+# Shown for every branch when ui.show_status is off (never mutated)
+EMPTY_STATUS = BranchStatus()
+
+# Seconds to wait after a keystroke before filtering, so bursts filter once
+FILTER_DEBOUNCE = 0.05
+
+# (upper bound in seconds, divisor, labels) for format_time_ago, days beyond.
+# Minute and hour labels are few, so they are built once and indexed
+TIME_AGO_UNITS = (
+    (3600, 60, tuple(f"{n}m" for n in range(60))),
+    (86400, 3600, tuple(f"{n}h" for n in range(24))),
+)
+
+
+def format_time_ago(dt: datetime | None, now: datetime | None = None) -> str:
+    """Format datetime as relative time string (pass now to reuse one clock read)."""
     if dt is None:
         return ""
-    now = datetime.now()
+    if now is None:
+        now = datetime.now()
     diff = now - dt
-    seconds = diff.total_seconds()
+    seconds = diff.days * 86400 + diff.seconds
 
     if seconds < 60:
         return "now"
-    elif seconds < 3600:
-        return f"{int(seconds // 60)}m"
-    elif seconds < 86400:
-        return f"{int(seconds // 3600)}h"
-    else:
-        return f"{int(seconds // 86400)}d"
+    for limit, divisor, labels in TIME_AGO_UNITS:
+        if seconds < limit:
+            return labels[seconds // divisor]
+    return f"{seconds // 86400}d"
 
 
-class ConfirmDialog(ModalScreen[bool]):
-    """Modal dialog for yes/no confirmation."""
+ResultType = TypeVar("ResultType")
 
-    CSS = """
-    ConfirmDialog {
+
+class _BaseDialog(ModalScreen[ResultType]):
+    """Base for modal dialogs: centered bordered box with a row of buttons."""
+
+    # DEFAULT_CSS is inherited by subclasses (screen CSS is not), so the
+    # shared rules are parsed once; dialogs only add what differs
+    DEFAULT_CSS = """
+    _BaseDialog {
         align: center middle;
     }
-    ConfirmDialog > Container {
+    _BaseDialog > Container {
         width: 50;
         height: auto;
         border: thick $primary;
         background: $surface;
         padding: 1 2;
     }
-    ConfirmDialog Label {
+    _BaseDialog .title {
         width: 100%;
         text-align: center;
+        text-style: bold;
         margin-bottom: 1;
     }
-    ConfirmDialog Horizontal {
+    _BaseDialog Horizontal {
         width: 100%;
         height: auto;
         align: center middle;
     }
-    ConfirmDialog Button {
+    _BaseDialog Button {
         margin: 0 1;
     }
     """
 
+
+class ConfirmDialog(_BaseDialog[bool]):
+    """Modal dialog for yes/no confirmation."""
+
+    CSS = """
+    ConfirmDialog Label {
+        width: 100%;
+        text-align: center;
+        margin-bottom: 1;
+    }
+    """
+
     def __init__(self, message: str):
         super().__init__()
         self.message = message
@@ -87,19 +122,13 @@ class ConfirmDialog(ModalScreen[bool]):
         self.dismiss(event.button.id == "yes")
 
 
-class AlertDialog(ModalScreen[None]):
+class AlertDialog(_BaseDialog[None]):
     """Modal dialog for alert messages."""
 
     CSS = """
-    AlertDialog {
-        align: center middle;
-    }
     AlertDialog > Container {
         width: 60;
-        height: auto;
         border: thick $warning;
-        background: $surface;
-        padding: 1 2;
     }
     AlertDialog Label {
         width: 100%;
@@ -107,6 +136,7 @@ class AlertDialog(ModalScreen[None]):
     }
     AlertDialog Button {
         width: 100%;
+        margin: 0;
     }
     """
 
@@ -133,26 +163,13 @@ class CreateWorktreeResult:
     create_branch: bool = False
 
 
-class CreateWorktreeDialog(ModalScreen[CreateWorktreeResult | None]):
+class CreateWorktreeDialog(_BaseDialog[CreateWorktreeResult | None]):
     """Dialog for creating new worktree with mode selection."""
 
     CSS = """
-    CreateWorktreeDialog {
-        align: center middle;
-    }
     CreateWorktreeDialog > Container {
         width: 60;
-        height: auto;
         max-height: 80%;
-        border: thick $primary;
-        background: $surface;
-        padding: 1 2;
-    }
-    CreateWorktreeDialog .title {
-        width: 100%;
-        text-align: center;
-        text-style: bold;
-        margin-bottom: 1;
     }
     CreateWorktreeDialog .field-label {
         margin-top: 1;
@@ -161,14 +178,8 @@ class CreateWorktreeDialog(ModalScreen[CreateWorktreeResult | None]):
         width: 100%;
     }
     CreateWorktreeDialog #mode-buttons {
-        width: 100%;
-        height: auto;
-        align: center middle;
         margin-bottom: 1;
     }
-    CreateWorktreeDialog .mode-btn {
-        margin: 0 1;
-    }
     CreateWorktreeDialog .mode-btn.-active {
         background: $primary;
     }
@@ -182,14 +193,8 @@ class CreateWorktreeDialog(ModalScreen[CreateWorktreeResult | None]):
         margin-top: 1;
     }
     CreateWorktreeDialog Horizontal {
-        width: 100%;
-        height: auto;
-        align: center middle;
         margin-top: 1;
     }
-    CreateWorktreeDialog Button {
-        margin: 0 1;
-    }
     """
 
     def __init__(
@@ -205,9 +210,13 @@ class CreateWorktreeDialog(ModalScreen[CreateWorktreeResult | None]):
         self.default_base = default_base
         self.branches = branches
         self.tags = tags
+        # Matchers reuse the previous keystroke's work while the query grows
+        self._branch_matcher = IncrementalMatcher(branches)
+        self._tag_matcher = IncrementalMatcher(tags)
         self.is_new_branch = is_new_branch
         self._filtered_items: list[str] = []
         self._mode = "branch"  # "branch", "commit", "tag"
+        self._filter_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         with Container():
@@ -215,19 +224,27 @@ class CreateWorktreeDialog(ModalScreen[CreateWorktreeResult | None]):
             yield Label(f"Name: {self.worktree_name}")
 
             # Mode selection buttons
+            # Widgets touched on every mode switch/keystroke are kept as attributes
+            self._mode_buttons = {
+                "branch": Button("Branch", id="mode-branch", classes="mode-btn -active"),
+                "commit": Button("Commit", id="mode-commit", classes="mode-btn"),
+                "tag": Button("Tag", id="mode-tag", classes="mode-btn"),
+            }
             with Horizontal(id="mode-buttons"):
-                yield Button("Branch", id="mode-branch", classes="mode-btn -active")
-                yield Button("Commit", id="mode-commit", classes="mode-btn")
-                yield Button("Tag", id="mode-tag", classes="mode-btn")
+                yield from self._mode_buttons.values()
 
             # Dynamic field label
-            yield Label("Base branch:", id="field-label", classes="field-label")
-            yield Input(value=self.default_base, id="value-input")
-            yield ListView(id="suggestion-list")
+            self._field_label = Label("Base branch:", id="field-label", classes="field-label")
+            self._value_input = Input(value=self.default_base, id="value-input")
+            self._suggestion_list = ListView(id="suggestion-list")
+            yield self._field_label
+            yield self._value_input
+            yield self._suggestion_list
 
             # Create branch checkbox (hidden by default)
-            with Container(id="checkbox-container"):
-                yield Checkbox("Create new branch", id="create-branch", value=False)
+            self._checkbox = Checkbox("Create new branch", id="create-branch", value=False)
+            self._checkbox_container = Container(self._checkbox, id="checkbox-container")
+            yield self._checkbox_container
 
             with Horizontal():
                 yield Button("Create", id="create", variant="primary")
@@ -235,25 +252,24 @@ class CreateWorktreeDialog(ModalScreen[CreateWorktreeResult | None]):
 
     def on_mount(self) -> None:
         self._update_mode("branch")
-        self.query_one("#value-input", Input).focus()
+        self._value_input.focus()
 
     def _update_mode(self, mode: str) -> None:
         """Update UI based on selected mode."""
         self._mode = mode
 
         # Update button styles
-        for btn_id in ["mode-branch", "mode-commit", "mode-tag"]:
-            btn = self.query_one(f"#{btn_id}", Button)
-            if btn_id == f"mode-{mode}":
+        for btn_mode, btn in self._mode_buttons.items():
+            if btn_mode == mode:
                 btn.add_class("-active")
             else:
                 btn.remove_class("-active")
 
         # Update field label
-        label = self.query_one("#field-label", Label)
-        input_field = self.query_one("#value-input", Input)
-        checkbox_container = self.query_one("#checkbox-container", Container)
-        checkbox = self.query_one("#create-branch", Checkbox)
+        label = self._field_label
+        input_field = self._value_input
+        checkbox_container = self._checkbox_container
+        checkbox = self._checkbox
 
         if mode == "branch":
             label.update("Base branch:")
@@ -274,21 +290,23 @@ class CreateWorktreeDialog(ModalScreen[CreateWorktreeResult | None]):
 
     def _refresh_suggestions(self, filter_text: str = "") -> None:
         """Refresh suggestion list based on mode and filter."""
-        list_view = self.query_one("#suggestion-list", ListView)
+        list_view = self._suggestion_list
         list_view.clear()
 
         if self._mode == "branch":
-            items = self.branches
+            matcher = self._branch_matcher
         elif self._mode == "tag":
-            items = self.tags
+            matcher = self._tag_matcher
         else:
             # No suggestions for commit SHA
             self._filtered_items = []
             return
 
-        self._filtered_items = fuzzy_match(items, filter_text)
+        # Empty filter matches everything, skip the matcher entirely
+        self._filtered_items = matcher.match(filter_text) if filter_text else matcher.items
+        append = list_view.append
         for item in self._filtered_items[:10]:  # Limit to 10
-            list_view.append(ListItem(Label(item)))
+            append(ListItem(Label(item)))
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         btn_id = event.button.id
@@ -312,14 +330,17 @@ class CreateWorktreeDialog(ModalScreen[CreateWorktreeResult | None]):
 
     def on_input_changed(self, event: Input.Changed) -> None:
         if event.input.id == "value-input":
-            self._refresh_suggestions(event.value)
+            if self._filter_timer is not None:
+                self._filter_timer.stop()
+            self._filter_timer = self.set_timer(
+                FILTER_DEBOUNCE, partial(self._refresh_suggestions, event.value)
+            )
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
-        list_view = self.query_one("#suggestion-list", ListView)
+        list_view = self._suggestion_list
         if list_view.index is not None and self._filtered_items:
             selected = self._filtered_items[list_view.index]
-            input_field = self.query_one("#value-input", Input)
-            input_field.value = selected
+            self._value_input.value = selected
             self._submit()
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
@@ -328,7 +349,7 @@ class CreateWorktreeDialog(ModalScreen[CreateWorktreeResult | None]):
 
     def _submit(self) -> None:
         """Submit the dialog with current values."""
-        value = self.query_one("#value-input", Input).value.strip()
+        value = self._value_input.value.strip()
         if not value:
             return
 
@@ -339,7 +360,7 @@ class CreateWorktreeDialog(ModalScreen[CreateWorktreeResult | None]):
             )
         else:
             # commit or tag mode
-            create_branch = self.query_one("#create-branch", Checkbox).value
+            create_branch = self._checkbox.value
             result = CreateWorktreeResult(
                 name=self.worktree_name,
                 commit=value,
@@ -349,40 +370,16 @@ class CreateWorktreeDialog(ModalScreen[CreateWorktreeResult | None]):
         self.dismiss(result)
 
 
-class WorktreeActionDialog(ModalScreen[str | None]):
+class WorktreeActionDialog(_BaseDialog[str | None]):
     """Dialog for actions on existing worktree."""
 
     CSS = """
-    WorktreeActionDialog {
-        align: center middle;
-    }
-    WorktreeActionDialog > Container {
-        width: 50;
-        height: auto;
-        border: thick $primary;
-        background: $surface;
-        padding: 1 2;
-    }
-    WorktreeActionDialog .title {
-        width: 100%;
-        text-align: center;
-        text-style: bold;
-        margin-bottom: 1;
-    }
     WorktreeActionDialog .path {
         width: 100%;
         text-align: center;
         color: $text-muted;
         margin-bottom: 1;
     }
-    WorktreeActionDialog Horizontal {
-        width: 100%;
-        height: auto;
-        align: center middle;
-    }
-    WorktreeActionDialog Button {
-        margin: 0 1;
-    }
     """
 
     def __init__(self, branch: str, path: Path):
@@ -406,26 +403,13 @@ class WorktreeActionDialog(ModalScreen[str | None]):
             self.dismiss(None)
 
 
-class PruneDialog(ModalScreen[list[str] | None]):
+class PruneDialog(_BaseDialog[list[str] | None]):
     """Dialog for selecting stale worktrees to prune."""
 
     CSS = """
-    PruneDialog {
-        align: center middle;
-    }
     PruneDialog > Container {
         width: 60;
-        height: auto;
         max-height: 80%;
-        border: thick $primary;
-        background: $surface;
-        padding: 1 2;
-    }
-    PruneDialog .title {
-        width: 100%;
-        text-align: center;
-        text-style: bold;
-        margin-bottom: 1;
     }
     PruneDialog .item {
         height: auto;
@@ -436,26 +420,23 @@ class PruneDialog(ModalScreen[list[str] | None]):
         margin-left: 2;
     }
     PruneDialog Horizontal {
-        width: 100%;
-        height: auto;
-        align: center middle;
         margin-top: 1;
     }
-    PruneDialog Button {
-        margin: 0 1;
-    }
     """
 
     def __init__(self, stale: list[tuple[str, str]]):
         super().__init__()
         self.stale = stale
+        # Checkbox per stale branch, read back when the dialog is confirmed
+        self._checkboxes: dict[str, Checkbox] = {}
 
     def compose(self) -> ComposeResult:
         with Container():
             yield Label(f"Found {len(self.stale)} stale worktrees:", classes="title")
             for branch, reason in self.stale:
                 with Horizontal(classes="item"):
-                    yield Checkbox(branch, value=True, id=f"cb-{branch}")
+                    self._checkboxes[branch] = Checkbox(branch, value=True, id=f"cb-{branch}")
+                    yield self._checkboxes[branch]
                     yield Label(f"({reason})", classes="reason")
             with Horizontal():
                 yield Button("Delete selected", id="delete", variant="error")
@@ -463,48 +444,22 @@ class PruneDialog(ModalScreen[list[str] | None]):
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "delete":
-            selected = []
-            for branch, _ in self.stale:
-                cb = self.query_one(f"#cb-{branch}", Checkbox)
-                if cb.value:
-                    selected.append(branch)
+            selected = [branch for branch, cb in self._checkboxes.items() if cb.value]
             self.dismiss(selected if selected else None)
         else:
             self.dismiss(None)
 
 
-class MultiDeleteDialog(ModalScreen[bool]):
+class MultiDeleteDialog(_BaseDialog[bool]):
     """Dialog for confirming multi-delete."""
 
     CSS = """
-    MultiDeleteDialog {
-        align: center middle;
-    }
-    MultiDeleteDialog > Container {
-        width: 50;
-        height: auto;
-        border: thick $primary;
-        background: $surface;
-        padding: 1 2;
-    }
-    MultiDeleteDialog .title {
-        width: 100%;
-        text-align: center;
-        text-style: bold;
-        margin-bottom: 1;
-    }
     MultiDeleteDialog .branch {
         margin-left: 2;
     }
     MultiDeleteDialog Horizontal {
-        width: 100%;
-        height: auto;
-        align: center middle;
         margin-top: 1;
     }
-    MultiDeleteDialog Button {
-        margin: 0 1;
-    }
     """
 
     def __init__(self, branches: list[str]):
@@ -524,27 +479,17 @@ class MultiDeleteDialog(ModalScreen[bool]):
         self.dismiss(event.button.id == "delete")
 
 
-class UncommittedWarningDialog(ModalScreen[bool]):
+class UncommittedWarningDialog(_BaseDialog[bool]):
     """Dialog warning about uncommitted changes in base branch."""
 
     CSS = """
-    UncommittedWarningDialog {
-        align: center middle;
-    }
     UncommittedWarningDialog > Container {
         width: 60;
-        height: auto;
         max-height: 80%;
         border: thick $warning;
-        background: $surface;
-        padding: 1 2;
     }
     UncommittedWarningDialog .title {
-        width: 100%;
-        text-align: center;
-        text-style: bold;
         color: $warning;
-        margin-bottom: 1;
     }
     UncommittedWarningDialog .branch-info {
         margin-bottom: 1;
@@ -558,14 +503,8 @@ class UncommittedWarningDialog(ModalScreen[bool]):
         margin-left: 2;
     }
     UncommittedWarningDialog Horizontal {
-        width: 100%;
-        height: auto;
-        align: center middle;
         margin-top: 1;
     }
-    UncommittedWarningDialog Button {
-        margin: 0 1;
-    }
     """
 
     def __init__(self, branch: str, files: list[str]):
@@ -594,6 +533,9 @@ class UncommittedWarningDialog(ModalScreen[bool]):
 class BranchItem(ListItem):
     """List item representing a branch with status indicators."""
 
+    # Widget bases keep a __dict__, but slot reads skip the dict lookup
+    __slots__ = ("branch", "has_worktree", "is_current", "status", "selected_for_delete", "_line")
+
     def __init__(
         self,
         branch: str,
@@ -601,6 +543,7 @@ class BranchItem(ListItem):
         is_current: bool,
         status: BranchStatus,
         selected: bool = False,
+        now: datetime | None = None,
     ):
         super().__init__()
         self.branch = branch
@@ -608,13 +551,27 @@ class BranchItem(ListItem):
         self.is_current = is_current
         self.status = status
         self.selected_for_delete = selected
+        # Inputs don't change after construction, format the row once
+        self._line = self._format_line(now)
 
     # Column widths for alignment
     BRANCH_WIDTH = 20
     STATUS_WIDTH = 12
     SYNC_WIDTH = 8
 
-    def compose(self) -> ComposeResult:
+    # Boolean status flags in display order; each group shows only its
+    # first set flag (rebase wins over merge)
+    _FLAG_GROUPS = (
+        (("rebase_in_progress", "[R]"), ("merge_in_progress", "[M]")),
+        (("has_stash", "[S]"),),
+    )
+    # Status column of a clean branch, the common case
+    _CLEAN_STATUS = " " * STATUS_WIDTH
+
+    def _format_line(self, now: datetime | None) -> str:
+        """Build the row text; now is the reference time for the age column."""
+        status = self.status
+
         # Column 1: Worktree indicator (emoji = 2 visual chars)
         wt_icon = "📁" if self.has_worktree else "· "
 
@@ -627,36 +584,44 @@ class BranchItem(ListItem):
             current_icon = "  "
 
         # Column 3: Branch name (fixed width, left-aligned)
-        branch_col = f"{self.branch:<{self.BRANCH_WIDTH}}"
+        branch_col = self.branch.ljust(self.BRANCH_WIDTH)
 
         # Column 4: Status indicators (fixed width)
-        status_parts = []
-        if self.status.dirty:
-            status_parts.append("*")
-        if self.status.untracked_count > 0:
-            status_parts.append(f"[+{self.status.untracked_count}]")
-        if self.status.rebase_in_progress:
-            status_parts.append("[R]")
-        elif self.status.merge_in_progress:
-            status_parts.append("[M]")
-        if self.status.has_stash:
-            status_parts.append("[S]")
-        status_col = f"{' '.join(status_parts):<{self.STATUS_WIDTH}}"
+        if not (
+            status.dirty
+            or status.untracked_count > 0
+            or status.rebase_in_progress
+            or status.merge_in_progress
+            or status.has_stash
+        ):
+            status_col = self._CLEAN_STATUS
+        else:
+            status_parts = ["*"] if status.dirty else []
+            if status.untracked_count > 0:
+                status_parts.append(f"[+{status.untracked_count}]")
+            for group in self._FLAG_GROUPS:
+                for attr, tag in group:
+                    if getattr(status, attr):
+                        status_parts.append(tag)
+                        break
+            status_col = " ".join(status_parts).ljust(self.STATUS_WIDTH)
 
         # Column 5: Ahead/behind (fixed width)
         ab_parts = []
-        if self.status.ahead > 0:
-            ab_parts.append(f"↑{self.status.ahead}")
-        if self.status.behind > 0:
-            ab_parts.append(f"↓{self.status.behind}")
-        sync_col = f"{' '.join(ab_parts):<{self.SYNC_WIDTH}}"
+        if status.ahead > 0:
+            ab_parts.append(f"↑{status.ahead}")
+        if status.behind > 0:
+            ab_parts.append(f"↓{status.behind}")
+        sync_col = " ".join(ab_parts).ljust(self.SYNC_WIDTH)
 
         # Column 6: Last commit time
-        time_col = format_time_ago(self.status.last_commit_time)
+        time_col = format_time_ago(status.last_commit_time, now)
 
         # Combine all columns
-        line = f"{wt_icon} {current_icon}{branch_col} {status_col} {sync_col} {time_col}"
-        yield Label(line)
+        return f"{wt_icon} {current_icon}{branch_col} {status_col} {sync_col} {time_col}"
+
+    def compose(self) -> ComposeResult:
+        yield Label(self._line)
 
 
 class WorktreeApp(App[Path | None]):
@@ -711,6 +676,7 @@ class WorktreeApp(App[Path | None]):
         Binding("escape", "quit", "Quit"),
         Binding("d", "delete", "Delete"),
         Binding("p", "prune", "Prune"),
+        Binding("e", "show_errors", "Errors", show=False),
         Binding("space", "toggle_select", "Multi-select", show=False),
         Binding("enter", "select", "Select", show=False),
     ]
@@ -721,6 +687,8 @@ class WorktreeApp(App[Path | None]):
         self.config = config or load_config(manager.root)
         self.worktrees = manager.list_worktrees()
         self.branches = manager.list_local_branches()
+        # Reuses the previous keystroke's work while the filter grows
+        self._branch_matcher = IncrementalMatcher(self.branches)
         self.tags = manager.list_tags()
         self.current_branch = manager.get_current_branch()
         # Base branch for new worktrees (branch where app was launched)
@@ -728,24 +696,40 @@ class WorktreeApp(App[Path | None]):
         self.result_path: Path | None = None
         self.selected_branches: set[str] = set()
         self._status_cache: dict[str, BranchStatus] = {}
+        # Items currently in the branch list, in display order
+        self._shown_items: dict[str, BranchItem] = {}
+        self._filter_timer: Timer | None = None
+        # Set while a selection redraw is queued for the next event-loop turn
+        self._rerender_scheduled = False
+        # Set while worktrees are being removed in a worker thread
+        self._busy = False
+        # (branch, error) pairs from the last multi-delete/prune, shown on demand
+        self._last_errors: list[tuple[str, str]] = []
+        # find_stale_worktrees result, dropped on reload and when a removal starts
+        self._stale_worktrees: list[tuple[str, str]] | None = None
 
     def compose(self) -> ComposeResult:
         yield Header()
+        # Widgets updated on every keystroke/highlight are kept as attributes
+        self._branch_input = Input(placeholder="Filter branches...", id="branch-input")
+        self._branch_list = ListView(id="branch-list")
+        self._preview = Static("", id="preview-content")
+        self._status_bar = Static("", id="status")
         with Vertical(id="main-container"):
             with Container(id="input-container"):
-                yield Input(placeholder="Filter branches...", id="branch-input")
+                yield self._branch_input
             yield Label("Branches:", id="branches-label")
-            yield ListView(id="branch-list")
+            yield self._branch_list
             if self.config.ui.show_preview:
                 with Vertical(id="preview-container"):
                     yield Label("Preview:", id="preview-label")
-                    yield Static("", id="preview-content")
-            yield Static("", id="status")
+                    yield self._preview
+            yield self._status_bar
         yield Footer()
 
     def on_mount(self) -> None:
         self._refresh_branch_list()
-        self.query_one("#branch-input", Input).focus()
+        self._branch_input.focus()
 
         # Check for stale worktrees on startup
         if self.config.prune.auto_suggest:
@@ -760,54 +744,142 @@ class WorktreeApp(App[Path | None]):
         return self._status_cache[branch]
 
     def _refresh_branch_list(self, filter_text: str = "") -> None:
-        """Refresh the branch list, optionally filtering with fuzzy search."""
+        """Reload worktrees and statuses, then redraw the filtered list."""
+        self._reload_data()
+        self._rerender(filter_text)
+
+    def _reload_data(self) -> None:
+        """Re-read worktrees and prefetch statuses of all branches in one batch."""
         self.worktrees = self.manager.list_worktrees()
+        self._stale_worktrees = None
         self._status_cache.clear()
-        list_view = self.query_one("#branch-list", ListView)
-        list_view.clear()
-
-        # Use fuzzy matching
-        filtered = fuzzy_match(self.branches, filter_text)
-
-        for branch in filtered:
-            has_wt = branch in self.worktrees
-            is_current = branch == self.current_branch
-            status = self._get_branch_status(branch) if self.config.ui.show_status else BranchStatus()
-            selected = branch in self.selected_branches
-            list_view.append(BranchItem(branch, has_wt, is_current, status, selected))
+        if self.config.ui.show_status:
+            self._status_cache.update(self.manager.get_all_branch_statuses(self.branches))
+
+        # Worktree/current flags may have changed, rebuild every item
+        self._branch_list.clear()
+        self._shown_items = {}
+
+    def _rerender(self, filter_text: str = "") -> None:
+        """
+        Redraw the branch list, optionally filtering with fuzzy search.
+
+        Items still shown with the same status and selection are kept, only
+        the difference is removed/mounted. If kept items would change order
+        (fuzzy scores shift), they are rebuilt instead of moved.
+        """
+        list_view = self._branch_list
+
+        # Use fuzzy matching (empty filter shows all branches as-is)
+        filtered = self._branch_matcher.match(filter_text) if filter_text else self.branches
+
+        # Statuses are prefetched by _reload_data, batch-fetch any stragglers
+        if self.config.ui.show_status:
+            missing = [b for b in filtered if b not in self._status_cache]
+            if missing:
+                self._status_cache.update(self.manager.get_all_branch_statuses(missing))
+
+        # Hoist attribute lookups out of the per-branch loop
+        selected_set = self.selected_branches
+        show_status = self.config.ui.show_status
+        get_status = self._get_branch_status
+        rows = [
+            (branch, get_status(branch) if show_status else EMPTY_STATUS, branch in selected_set)
+            for branch in filtered
+        ]
+
+        old_items = self._shown_items
+        keep = [
+            branch
+            for branch, status, selected in rows
+            if branch in old_items
+            and old_items[branch].status == status
+            and old_items[branch].selected_for_delete == selected
+        ]
+        keep_set = set(keep)
+        if keep != [branch for branch in old_items if branch in keep_set]:
+            keep_set = set()
+
+        removals = [item.remove() for branch, item in old_items.items() if branch not in keep_set]
+
+        now = datetime.now()
+        worktrees = self.worktrees
+        current = self.current_branch
+        items: dict[str, BranchItem] = {}
+        for branch, status, selected in rows:
+            if branch in keep_set:
+                items[branch] = old_items[branch]
+            else:
+                items[branch] = BranchItem(
+                    branch, branch in worktrees, branch == current, status, selected, now
+                )
+        self._shown_items = items
+
+        # Mount new items in front of the next kept item (or at the end)
+        pending = []
+        anchor = None
+        for branch in reversed(filtered):
+            if branch in keep_set:
+                anchor = items[branch]
+            else:
+                pending.append((items[branch], anchor))
+        for item, anchor in reversed(pending):
+            if anchor is None:
+                list_view.mount(item)
+            else:
+                list_view.mount(item, before=anchor)
 
-        # Auto-select first item
-        if len(list_view.children) > 0:
+        # Auto-select first item, once removed items are really gone
+        if removals:
+            self.call_later(self._highlight_first_after, removals)
+        else:
+            self._highlight_first()
+
+    def _highlight_first(self) -> None:
+        """Highlight the first list item."""
+        list_view = self._branch_list
+        # Reset first so the highlight event fires even if index stays 0
+        list_view.index = None
+        if self._shown_items:
             list_view.index = 0
 
+    async def _highlight_first_after(self, removals: list) -> None:
+        """Highlight the first list item once pending removals are done."""
+        for removal in removals:
+            await removal
+        self._highlight_first()
+
     def _update_preview(self, branch: str) -> None:
         """Update commit preview for branch."""
         if not self.config.ui.show_preview:
             return
 
-        preview = self.query_one("#preview-content", Static)
+        preview = self._preview
         commits = self.manager.get_recent_commits(branch, self.config.ui.preview_count)
 
         if not commits:
             preview.update("No commits")
             return
 
-        lines = []
-        for commit in commits:
-            time_ago = format_time_ago(commit.time)
-            lines.append(f"{commit.sha} {commit.message} ({time_ago})")
-
-        preview.update("\n".join(lines))
+        now = datetime.now()
+        preview.update(
+            "\n".join(
+                f"{commit.sha} {commit.message} ({format_time_ago(commit.time, now)})"
+                for commit in commits
+            )
+        )
 
     def on_input_changed(self, event: Input.Changed) -> None:
         if event.input.id == "branch-input":
-            self._refresh_branch_list(event.value)
+            if self._filter_timer is not None:
+                self._filter_timer.stop()
+            self._filter_timer = self.set_timer(FILTER_DEBOUNCE, partial(self._rerender, event.value))
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle Enter in filter input - always create new branch."""
         if event.input.id == "branch-input":
             branch_name = event.value.strip()
-            if branch_name:
+            if branch_name and not self._removal_in_progress():
                 # Always open create dialog for new branch
                 is_new = not self.manager.branch_exists(branch_name)
                 self.push_screen(
@@ -832,7 +904,7 @@ class WorktreeApp(App[Path | None]):
                     ConfirmDialog(f"Switch to {branch}?"),
                     self._on_switch_confirm,
                 )
-            else:
+            elif not self._removal_in_progress():
                 # No worktree - create it
                 is_new = not self.manager.branch_exists(branch)
                 self.push_screen(
@@ -854,6 +926,12 @@ class WorktreeApp(App[Path | None]):
                 self.result_path = self.worktrees[branch]
                 self.exit(self.result_path)
 
+    def _highlighted_branch(self) -> str | None:
+        """Branch of the highlighted list item, or None."""
+        # highlighted_child re-validates the index on every access, read it once
+        child = self._branch_list.highlighted_child
+        return child.branch if isinstance(child, BranchItem) else None
+
     def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
         if isinstance(event.item, BranchItem):
             self._update_preview(event.item.branch)
@@ -861,16 +939,13 @@ class WorktreeApp(App[Path | None]):
     def _on_worktree_action(self, action: str | None) -> None:
         """Handle worktree action dialog result."""
         if action == "goto":
-            list_view = self.query_one("#branch-list", ListView)
-            if list_view.highlighted_child and isinstance(list_view.highlighted_child, BranchItem):
-                branch = list_view.highlighted_child.branch
-                if branch in self.worktrees:
-                    self.result_path = self.worktrees[branch]
-                    self.exit(self.result_path)
+            branch = self._highlighted_branch()
+            if branch in self.worktrees:
+                self.result_path = self.worktrees[branch]
+                self.exit(self.result_path)
         elif action == "delete":
-            list_view = self.query_one("#branch-list", ListView)
-            if list_view.highlighted_child and isinstance(list_view.highlighted_child, BranchItem):
-                branch = list_view.highlighted_child.branch
+            branch = self._highlighted_branch()
+            if branch is not None:
                 self._delete_worktree(branch)
 
     def _on_create_dialog(self, result: CreateWorktreeResult | None) -> None:
@@ -946,103 +1021,181 @@ class WorktreeApp(App[Path | None]):
 
     def _delete_worktree(self, branch: str) -> None:
         """Delete worktree after confirmation."""
+        if self._removal_in_progress():
+            return
         self.push_screen(
             ConfirmDialog(f"Delete worktree '{branch}'?"),
             lambda confirm: self._on_delete_confirm(confirm, branch),
         )
 
-    def _on_delete_confirm(self, confirm: bool, branch: str) -> None:
+    async def _on_delete_confirm(self, confirm: bool, branch: str) -> None:
         """Handle delete confirmation."""
         if not confirm:
             return
+        self._update_status(f"Deleting worktree: {branch}...")
+        self._start_removal()
         try:
-            self.manager.delete_worktree(branch)
-            self._update_status(f"Deleted worktree: {branch}")
-            self._refresh_branch_list()
+            await asyncio.to_thread(self.manager.delete_worktree, branch)
         except RuntimeError as e:
             self._update_status(f"Error: {e}")
+            return
+        finally:
+            self._busy = False
+        self._update_status(f"Deleted worktree: {branch}")
+        # Reload the list on the next loop turn, after the result is shown
+        self.call_later(self._refresh_branch_list)
 
     def action_delete(self) -> None:
         """Handle delete key binding."""
+        if self._removal_in_progress():
+            return
+
         # Check for multi-select first
         if self.selected_branches:
-            selected_with_wt = [b for b in self.selected_branches if b in self.worktrees]
+            selected_with_wt = list(self.selected_branches & self.worktrees.keys())
             if selected_with_wt:
                 self.push_screen(
                     MultiDeleteDialog(selected_with_wt),
-                    self._on_multi_delete_confirm,
+                    lambda confirm: self._on_multi_delete_confirm(confirm, selected_with_wt),
                 )
             return
 
         # Single delete
-        list_view = self.query_one("#branch-list", ListView)
-        if list_view.highlighted_child and isinstance(list_view.highlighted_child, BranchItem):
-            branch = list_view.highlighted_child.branch
-            if branch in self.worktrees:
-                self._delete_worktree(branch)
+        branch = self._highlighted_branch()
+        if branch in self.worktrees:
+            self._delete_worktree(branch)
 
-    def _on_multi_delete_confirm(self, confirm: bool) -> None:
+    async def _on_multi_delete_confirm(self, confirm: bool, selected_with_wt: list[str]) -> None:
         """Handle multi-delete confirmation."""
         if not confirm:
             return
 
-        selected_with_wt = [b for b in self.selected_branches if b in self.worktrees]
-        results = self.manager.prune_worktrees(selected_with_wt)
-
-        errors = [f"{b}: {e}" for b, e in results.items() if e]
-        success_count = len([b for b, e in results.items() if e is None])
-
-        self.selected_branches.clear()
-        self._refresh_branch_list()
+        success_count, errors = await self._prune_in_background(selected_with_wt, "Deleting")
 
         if errors:
-            self._update_status(f"Deleted {success_count}, errors: {'; '.join(errors)}")
+            self._update_status(
+                f"Deleted {success_count}, {len(errors)} errors (press 'e' for details)"
+            )
         else:
             self._update_status(f"Deleted {success_count} worktrees")
 
+        self.selected_branches.clear()
+        self.call_later(self._refresh_branch_list)
+
     def action_toggle_select(self) -> None:
         """Toggle multi-select for current branch."""
-        list_view = self.query_one("#branch-list", ListView)
-        if list_view.highlighted_child and isinstance(list_view.highlighted_child, BranchItem):
-            branch = list_view.highlighted_child.branch
-            if branch in self.selected_branches:
-                self.selected_branches.remove(branch)
-            else:
-                self.selected_branches.add(branch)
-            self._refresh_branch_list(self.query_one("#branch-input", Input).value)
+        branch = self._highlighted_branch()
+        if branch is None:
+            return
+        if branch in self.selected_branches:
+            self.selected_branches.remove(branch)
+        else:
+            self.selected_branches.add(branch)
+        self._schedule_rerender()
+
+    def _schedule_rerender(self) -> None:
+        """Queue one redraw for toggles made before the event loop gets to it."""
+        if not self._rerender_scheduled:
+            self._rerender_scheduled = True
+            self.call_later(self._scheduled_rerender)
+
+    def _scheduled_rerender(self) -> None:
+        self._rerender_scheduled = False
+        self._rerender(self._branch_input.value)
 
     def action_prune(self) -> None:
         """Show prune dialog for stale worktrees."""
-        stale = self.manager.find_stale_worktrees()
+        if self._removal_in_progress():
+            return
+
+        # Every create/delete/prune reloads data, so the cached result is
+        # only reused while worktrees are unchanged
+        if self._stale_worktrees is None:
+            self._stale_worktrees = self.manager.find_stale_worktrees()
+        stale = self._stale_worktrees
         if not stale:
             self._update_status("No stale worktrees found")
             return
 
         self.push_screen(PruneDialog(stale), self._on_prune_dialog)
 
-    def _on_prune_dialog(self, selected: list[str] | None) -> None:
+    async def _on_prune_dialog(self, selected: list[str] | None) -> None:
         """Handle prune dialog result."""
         if not selected:
             return
 
-        results = self.manager.prune_worktrees(selected)
-        errors = [f"{b}: {e}" for b, e in results.items() if e]
-        success_count = len([b for b, e in results.items() if e is None])
-
-        self._refresh_branch_list()
+        success_count, errors = await self._prune_in_background(selected, "Pruning")
 
         if errors:
-            self._update_status(f"Pruned {success_count}, errors: {'; '.join(errors)}")
+            self._update_status(
+                f"Pruned {success_count}, {len(errors)} errors (press 'e' for details)"
+            )
         else:
             self._update_status(f"Pruned {success_count} worktrees")
 
+        self.call_later(self._refresh_branch_list)
+
+    async def _prune_in_background(
+        self, branches: list[str], verb: str
+    ) -> tuple[int, list[tuple[str, str]]]:
+        """
+        Run prune_worktrees in a worker thread, reporting progress in the status bar.
+
+        Returns (success count, (branch, error) pairs); the pairs are also
+        kept for action_show_errors.
+        """
+
+        # call_from_thread would block each removal until the screen redraws,
+        # instead post updates to the event loop and let workers carry on
+        loop = asyncio.get_running_loop()
+
+        def on_progress(branch: str, done: int, total: int) -> None:
+            loop.call_soon_threadsafe(self._update_status, f"{verb} {done}/{total}: {branch}...")
+
+        self._update_status(f"{verb} {len(branches)} worktrees...")
+        self._start_removal()
+        try:
+            results = await asyncio.to_thread(self.manager.prune_worktrees, branches, on_progress)
+        finally:
+            self._busy = False
+
+        success_count = 0
+        errors = []
+        for branch, error in results.items():
+            if error is None:
+                success_count += 1
+            else:
+                errors.append((branch, error))
+        self._last_errors = errors
+        return success_count, errors
+
+    def _start_removal(self) -> None:
+        """Mark a worker-thread removal as running; worktree data goes stale."""
+        self._busy = True
+        self._stale_worktrees = None
+
+    def _removal_in_progress(self) -> bool:
+        """Tell the user to wait if a removal is running, return whether it is."""
+        if self._busy:
+            self._update_status("Removal in progress, please wait")
+        return self._busy
+
+    def action_show_errors(self) -> None:
+        """Show errors from the last multi-delete or prune."""
+        if not self._last_errors:
+            self._update_status("No errors to show")
+            return
+        self.push_screen(
+            AlertDialog("\n".join(f"{branch}: {error}" for branch, error in self._last_errors))
+        )
+
     def action_quit(self) -> None:
         """Quit without result."""
         self.exit(None)
 
     def _update_status(self, message: str) -> None:
         """Update status bar."""
-        self.query_one("#status", Static).update(message)
+        self._status_bar.update(message)
 
 
 def run_tui(manager: GitWorktreeManager, config: Config | None = None) -> Path | None: